@@ -1,14 +1,23 @@
 # Import necessary modules for the background script
+import os
 import re
 import sys
-import json
+import time
+import shlex
+import bisect
+import orjson
 import signal
 import asyncio
 import logging
-import aiofiles
+import tempfile
+import functools
 import configparser
+from typing import Optional
+from pathlib import Path
+from operator import itemgetter
+from dataclasses import dataclass
 from pushbullet import Pushbullet
-from datetime import datetime, timedelta
+from datetime import datetime
 
 # Configuration file path
 config_file = "tasky.config"
@@ -25,120 +34,277 @@ def read_config():
         config.read_file(file)
     return config
 
-async def aio_read_config():
+@dataclass(frozen=True, slots=True)
+class Settings:
     """
-    Asynchronously read the configuration from the specified file.
+    Typed snapshot of the settings in the configuration file.
+    """
+    log_file: str
+    tasks_file: str
+    completed_tasks_file: str
+    check_frequency: int
+    due_soon_secs: int
+    access_token: Optional[str]
+
+
+def read_settings():
+    """
+    Read the configuration file into a typed settings snapshot.
 
     Returns:
-        configparser.ConfigParser: Configuration object.
+        Settings: The parsed settings.
     """
-    config = configparser.ConfigParser()
-    async with aiofiles.open(config_file, mode='r') as file:
-        contents = await file.read()
-        config.read_string(contents)
-    return config
+    config = read_config()
+    return Settings(
+        # Log file path
+        log_file=config.get('Logs', 'log_file', fallback='tasky_log_file.log'),
+        # Tasks file path
+        tasks_file=config.get('paths', 'tasks_file', fallback='tasks.json'),
+        # Completed tasks file path
+        completed_tasks_file=config.get('paths', 'completed_tasks_file', fallback='completed_tasks.json'),
+        # Frequency to check for notifications in seconds
+        check_frequency=int(config.get('notification', 'check_frequency_seconds', fallback=20)),
+        # Seconds before a task is due to send a 'due soon' notification
+        due_soon_secs=int(config.get('notification', 'due_soon_threshold', fallback=60)),
+        # Pushbullet API access token
+        access_token=config.get('Pushbullet', 'access_token', fallback=None),
+    )
 
 # Load configuration
-config = read_config()
-
-# Log file path
-log_file = config.get('Logs', 'log_file', fallback='tasky_log_file.log')
+settings = read_settings()
 
 # Configure logging to write logs to the specified file
-logging.basicConfig(filename=log_file, level=logging.INFO)
+logging.basicConfig(filename=settings.log_file, level=logging.INFO)
+
+# Pending tasks as (due time, task) pairs sorted by due time, and the modification
+# time of the tasks file they were loaded from
+scheduled_tasks = []
+scheduled_tasks_mtime = None
+
+# Background tasks running due task commands, referenced here until they finish
+command_tasks = set()
 
-# Tasks file path
-tasks_file = config.get('paths', 'tasks_file', fallback='tasks.json')
+# Time of the previous due task check, so each 'due soon' notification is sent once
+last_check_time = None
 
-# Completed tasks file path
-completed_tasks_file = config.get('paths', 'completed_tasks_file', fallback='completed_tasks.json')
+# Pattern for task names that schedule a command, e.g. "-e ls" or "--execute ls"
+command_pattern = re.compile(r'^(?:-e|--execute)\s+(.*)$')
 
-# Frequency to check for notifications in seconds
-check_frequency = int(config.get('notification', 'check_frequency_seconds', fallback=20))
+# Characters with special meaning to the shell; commands containing them are run through one
+shell_metacharacters = frozenset('|&;<>()$`*?[]{}~#\n')
 
-class TaskEncoder(json.JSONEncoder):
+# Shared Pushbullet client, created on first use and reused for every notification
+pb_client = None
+pb_client_token = None
+pb_client_lock = asyncio.Lock()
+
+def _encode_default(obj):
     """
-    JSON Encoder for tasks containing datetime objects.
+    Serialize objects orjson does not handle itself, such as task datetimes.
+
+    Args:
+        obj (object): Object to serialize.
+
+    Returns:
+        str: Serialized datetime.
+
+    Raises:
+        TypeError: If the object type is not supported.
     """
-    def default(self, obj):
-        if isinstance(obj, datetime):
-            return obj.strftime("%Y-%m-%d %H:%M:%S")
-        return super().default(obj)
+    if isinstance(obj, datetime):
+        return obj.isoformat(sep=' ', timespec='seconds')
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
 
 
-async def aio_read_tasks():
+def _read_json_sync(path):
     """
-    Asynchronously read tasks from the tasks file.
+    Read and parse a JSON file in a single blocking call.
+
+    Args:
+        path (str): Path to the JSON file.
 
     Returns:
-        list: List of tasks.
+        list: Parsed contents, or an empty list if the file is empty.
     """
-    async with aiofiles.open(tasks_file, mode='r') as file:
-        content = await file.read()
-        return json.loads(content) if content else []
+    data = Path(path).read_bytes()
+    return orjson.loads(data) if data else []
 
 
-async def aio_write_tasks(tasks):
+def _atomic_write_sync(path, data):
     """
-    Asynchronously write tasks to the tasks file.
+    Write bytes to a file atomically in a single blocking call.
+
+    The data is written to a temporary file that then replaces the target, so an
+    interrupted write never leaves the target empty or truncated.
 
     Args:
-        tasks (list): List of tasks.
+        path (str): Path to the file.
+        data (bytes): Data to write.
+    """
+    # Use a unique temporary file, as tasky.py may be saving the same file at the same time
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path) or '.', prefix=os.path.basename(path))
+    try:
+        with os.fdopen(fd, mode='wb') as file:
+            file.write(data)
+            file.flush()
+            os.fsync(file.fileno())
+        # mkstemp creates the file private to the owner, so keep the target's permissions
+        try:
+            os.chmod(tmp_path, os.stat(path).st_mode & 0o777)
+        except FileNotFoundError:
+            os.chmod(tmp_path, 0o644)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.remove(tmp_path)
+        raise
+
+
+def _write_json_sync(path, obj):
+    """
+    Serialize an object and atomically write it to a JSON file in a single blocking call.
+
+    Args:
+        path (str): Path to the JSON file.
+        obj (list): Object to serialize.
     """
-    async with aiofiles.open(tasks_file, mode='w') as file:
-        await file.write(json.dumps(tasks, cls=TaskEncoder))
+    # Pass datetimes through to _encode_default to keep the on-disk format tasky.py writes
+    _atomic_write_sync(path, orjson.dumps(obj, default=_encode_default, option=orjson.OPT_PASSTHROUGH_DATETIME))
 
 
-async def aio_read_completed_tasks():
+def _dump_json_lines(objs):
     """
-    Asynchronously read completed tasks from the completed tasks file.
+    Serialize objects as JSON Lines, one object per newline-terminated line.
+
+    Args:
+        objs (list): Objects to serialize.
 
     Returns:
-        list: List of completed tasks.
+        bytes: Serialized lines.
+    """
+    option = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_APPEND_NEWLINE
+    return b''.join(orjson.dumps(obj, default=_encode_default, option=option) for obj in objs)
+
+
+def _iter_json_lines_sync(path):
+    """
+    Lazily parse a JSON Lines file, one line at a time.
+
+    Files still in the legacy single JSON array format are parsed as a whole.
+
+    Args:
+        path (str): Path to the JSON Lines file.
+
+    Yields:
+        object: Parsed object for each non-empty line.
+    """
+    with open(path, mode='rb') as file:
+        for line in file:
+            if not line.strip():
+                continue
+            if line.lstrip().startswith(b'['):
+                yield from orjson.loads(line + file.read())
+                return
+            yield orjson.loads(line)
+
+
+def _append_json_lines_sync(path, objs):
+    """
+    Append objects to a JSON Lines file in a single blocking call.
+
+    Args:
+        path (str): Path to the JSON Lines file.
+        objs (list): Objects to append.
+    """
+    with open(path, mode='ab') as file:
+        file.write(_dump_json_lines(objs))
+
+
+def _migrate_json_lines_sync(path):
+    """
+    Rewrite a legacy single JSON array file as JSON Lines, if needed.
+
+    Args:
+        path (str): Path to the file.
     """
     try:
-        async with aiofiles.open(completed_tasks_file, mode='r') as file:
-            content = await file.read()
-            return json.loads(content) if content else []
+        with open(path, mode='rb') as file:
+            # Only the first line is needed to tell the formats apart
+            is_legacy = file.readline().lstrip().startswith(b'[')
     except FileNotFoundError:
-        # If the file doesn't exist, create an empty file and return an empty list
-        async with aiofiles.open(completed_tasks_file, mode='w'):
-            pass
-        return []
+        return
+    if is_legacy:
+        _atomic_write_sync(path, _dump_json_lines(_iter_json_lines_sync(path)))
+
+
+async def aio_read_tasks():
+    """
+    Asynchronously read tasks from the tasks file.
+
+    Returns:
+        list: List of tasks.
+    """
+    return await asyncio.to_thread(_read_json_sync, settings.tasks_file)
+
+
+async def aio_write_tasks(tasks):
+    """
+    Asynchronously write tasks to the tasks file.
+
+    Args:
+        tasks (list): List of tasks.
+    """
+    await asyncio.to_thread(_write_json_sync, settings.tasks_file, tasks)
 
 
 async def aio_append_completed_tasks(completed_tasks):
     """
     Asynchronously append completed tasks to the completed tasks file.
 
+    Completed tasks are stored as JSON Lines, so appending only writes the new tasks
+    instead of reading and rewriting the whole history.
+
     Args:
         completed_tasks (list): List of completed tasks.
     """
     try:
-        # Read existing completed tasks from file
-        existing_completed_tasks = await aio_read_completed_tasks()
-
-        # Combine existing and new completed tasks
-        all_completed_tasks = existing_completed_tasks + completed_tasks
-
-        # Write the entire list to the file
-        await aio_write_completed_tasks(all_completed_tasks)
+        await asyncio.to_thread(_append_json_lines_sync, settings.completed_tasks_file, completed_tasks)
     except (PermissionError, FileNotFoundError):
         logging.warning("Error: Unable to append completed tasks. Check file permissions and try again.")
 
 
-async def aio_write_completed_tasks(completed_tasks):
+async def aio_migrate_completed_tasks():
     """
-    Asynchronously write completed tasks to the completed tasks file.
+    Asynchronously convert a legacy JSON array completed tasks file to JSON Lines.
+    """
+    try:
+        await asyncio.to_thread(_migrate_json_lines_sync, settings.completed_tasks_file)
+    except (PermissionError, ValueError):
+        logging.warning("Error: Unable to migrate completed tasks file. Check file permissions and contents.")
+
+
+async def aio_get_pushbullet_client(access_token):
+    """
+    Asynchronously get the shared Pushbullet client, creating it on first use.
+
+    The client is rebuilt only if the access token has changed since it was created.
 
     Args:
-        completed_tasks (list): List of completed tasks.
+        access_token (str): Pushbullet API access token.
+
+    Returns:
+        Pushbullet: Client for the access token.
     """
-    try:
-        async with aiofiles.open(completed_tasks_file, mode='w') as file:
-            await file.write(json.dumps(completed_tasks, cls=TaskEncoder))
-    except (PermissionError, FileNotFoundError):
-        logging.warning("Error: Unable to write completed tasks. Check file permissions and try again.")
+    global pb_client, pb_client_token
+    # Fast path once the client exists, without waiting on the lock
+    if pb_client is not None and pb_client_token == access_token:
+        return pb_client
+
+    async with pb_client_lock:
+        if pb_client is None or pb_client_token != access_token:
+            # The constructor validates the token over HTTPS, so keep it off the event loop
+            pb_client = await asyncio.to_thread(Pushbullet, access_token)
+            pb_client_token = access_token
+    return pb_client
 
 
 async def aio_send_notification(title, body):
@@ -149,18 +315,36 @@ async def aio_send_notification(title, body):
         title (str): Notification title.
         body (str): Notification body.
     """
-    config = await aio_read_config()
-    access_token = config.get("Pushbullet", "access_token", fallback=None)
+    # Use the token cached at startup (or on SIGHUP); the config file is never re-read here
+    access_token = settings.access_token
 
     try:
         if access_token:
-            pb = Pushbullet(access_token)
-            pb.push_note(title, body)
+            pb = await aio_get_pushbullet_client(access_token)
+            await asyncio.to_thread(pb.push_note, title, body)
         else:
             logging.warning("Pushbullet access token not found in the config file.")
     except Exception:
         logging.info("Error sending notification. Check internet connection, API key push limit and pushbullet.com to troubleshoot")
 
+
+@functools.lru_cache(maxsize=4096)
+def parse_task_time(task_time):
+    """
+    Parse a task time string from the tasks file.
+
+    Results are memoized, so each distinct time string is parsed only once per run
+    rather than on every check.
+
+    Args:
+        task_time (str): Task time in "%Y-%m-%d %H:%M:%S" format.
+
+    Returns:
+        float: Task time as a Unix timestamp.
+    """
+    return datetime.strptime(task_time, "%Y-%m-%d %H:%M:%S").timestamp()
+
+
 def extract_command(task_name):
     """
     Extract the command from a task name.
@@ -171,15 +355,43 @@ def extract_command(task_name):
     Returns:
         str: Extracted command, or None if no command is found.
     """
-    pattern = re.compile(r'^(-e|--execute)\s+(.*)$')
-    match = pattern.match(task_name)
+    # Most tasks are plain reminders, so skip the regex unless the prefix matches
+    if not task_name.startswith(('-e', '--execute')):
+        return None
+
+    match = command_pattern.match(task_name)
 
     if match:
-        return match.group(2)
+        return match.group(1)
 
     return None
 
 
+def split_command(command):
+    """
+    Split a command into arguments if it can be run without a shell.
+
+    Args:
+        command (str): Shell command.
+
+    Returns:
+        list: Command arguments, or None if the command needs a shell to run.
+    """
+    if any(char in shell_metacharacters for char in command):
+        return None
+
+    try:
+        argv = shlex.split(command)
+    except ValueError:
+        return None
+
+    # Leading variable assignments such as "FOO=bar cmd" also need a shell
+    if not argv or '=' in argv[0]:
+        return None
+
+    return argv
+
+
 async def aio_execute_command(command):
     """
     Asynchronously execute a shell command using Docker.
@@ -191,58 +403,136 @@ async def aio_execute_command(command):
         tuple: A tuple containing stdout and stderr as strings.
     """
     try:
-        process = await asyncio.create_subprocess_shell(
-            command,
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
-        )
+        process = None
+        argv = split_command(command)
+
+        if argv:
+            try:
+                # Run simple commands directly, without spawning an intermediate shell
+                process = await asyncio.create_subprocess_exec(
+                    *argv,
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.PIPE,
+                )
+            except FileNotFoundError:
+                # Not an executable (e.g. a shell builtin such as "cd"), so leave it to the shell
+                process = None
+
+        if process is None:
+            process = await asyncio.create_subprocess_shell(
+                command,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+            )
         stdout, stderr = await process.communicate()
         return stdout.decode(), stderr.decode()
     except Exception as e:
         logging.exception("Error occurred while executing command: %s", str(e))
         return None, str(e)
 
-async def aio_check_due_tasks():
+
+async def aio_run_task_command(command):
     """
-    Asynchronously check for due tasks and send notifications.
+    Asynchronously execute a due task's command and send its result as a notification.
+
+    Args:
+        command (str): Shell command.
+    """
+    output, error = await aio_execute_command(command)
+    await aio_send_notification("Tasky:", f"Command Execution Result\nCommand: {command}\nOutput: {output}\nError: {error}")
+
+
+async def aio_refresh_scheduled_tasks():
+    """
+    Asynchronously reload the pending tasks if the tasks file has changed.
 
-    This function checks the time difference between the current time and the scheduled time
-    of each task. If a task is due soon or overdue, it sends notifications accordingly.
+    The foreground script adds, updates and deletes tasks by rewriting the tasks file,
+    so the schedule is only rebuilt when the file's modification time changes.
     """
-    config = await aio_read_config()
-    due_soon_secs = int(config.get('notification', 'due_soon_threshold', fallback=60))
-    tasks = await aio_read_tasks()
-    current_time = datetime.now()
+    global scheduled_tasks, scheduled_tasks_mtime
+    try:
+        mtime = (await asyncio.to_thread(os.stat, settings.tasks_file)).st_mtime_ns
+    except FileNotFoundError:
+        scheduled_tasks, scheduled_tasks_mtime = [], None
+        return
 
-    tasks_to_remove = []
-    completed_tasks = []
+    if mtime != scheduled_tasks_mtime:
+        tasks = await aio_read_tasks()
+        scheduled_tasks = sorted(((parse_task_time(task['time']), task) for task in tasks), key=itemgetter(0))
+        scheduled_tasks_mtime = mtime
 
-    for task in tasks:
+
+async def aio_check_due_tasks():
+    """
+    Asynchronously check for due tasks and send notifications.
+
+    Pending tasks are kept sorted by due time, so only the tasks that are due soon or
+    overdue are visited, instead of every pending task on every check.
+    """
+    global last_check_time
+    await aio_refresh_scheduled_tasks()
+    current_time = time.time()
+    previous_check_time = last_check_time or current_time - settings.check_frequency
+    last_check_time = current_time
+    notifications = []
+
+    # Tasks that came within due_soon_secs of being due since the previous check get a 'due soon' notification
+    due_soon = settings.due_soon_secs
+    soon_start = bisect.bisect_right(scheduled_tasks, previous_check_time + due_soon, key=itemgetter(0))
+    soon_end = bisect.bisect_right(scheduled_tasks, current_time + due_soon, key=itemgetter(0))
+    for task_time, task in scheduled_tasks[soon_start:soon_end]:
+        notifications.append(("Tasky:", f"Task Due Soon\nTask: {task['name']} due in {settings.due_soon_secs} seconds"))
+
+    # Tasks at the front of the schedule up to the current time are due
+    due_end = bisect.bisect_right(scheduled_tasks, current_time, key=itemgetter(0))
+    completed_tasks = [task for task_time, task in scheduled_tasks[:due_end]]
+    del scheduled_tasks[:due_end]
+
+    for task in completed_tasks:
         task_name, task_time, priority = task['name'], task['time'], task['priority']
         command = extract_command(task_name)
 
-        task_time = datetime.strptime(task_time, "%Y-%m-%d %H:%M:%S")
-        time_difference = task_time - current_time
+        notifications.append(("Tasky:", f"Task Due\nTask: {task_name}\nTime: {task_time}\nPriority: {priority}"))
 
-        average = int(due_soon_secs - check_frequency)
-        if average < time_difference.total_seconds() <= due_soon_secs:
-            await aio_send_notification("Tasky:", f"Task Due Soon\nTask: {task_name} due in {due_soon_secs} seconds")
+        if command:
+            # Run the command in the background so a slow command does not hold up the next check
+            command_task = asyncio.create_task(aio_run_task_command(command))
+            command_tasks.add(command_task)
+            command_task.add_done_callback(command_tasks.discard)
 
-        if time_difference <= timedelta(minutes=0):
-            await aio_send_notification("Tasky:", f"Task Due\nTask: {task_name}\nTime: {task_time}\nPriority: {priority}")
-            completed_tasks.append(task)
-            tasks_to_remove.append(task)
+    # Send this check's notifications concurrently so their HTTPS requests overlap
+    if notifications:
+        await asyncio.gather(*(aio_send_notification(title, body) for title, body in notifications))
 
-            if command:
-                output, error = await aio_execute_command(command)
-                await aio_send_notification("Tasky:", f"Command Execution Result\nCommand: {command}\nOutput: {output}\nError: {error}")
+    # Only touch the task files when a task actually completed during this check
+    if completed_tasks:
+        await aio_append_completed_tasks(completed_tasks)
+        await aio_write_tasks([task for task_time, task in scheduled_tasks])
 
-    await aio_append_completed_tasks(completed_tasks)
 
-    for task in tasks_to_remove:
-        tasks.remove(task)
+def next_check_delay():
+    """
+    Get the number of seconds to wait before the next due task check.
+
+    The next check is timed for when the earliest pending task is due or due soon, but
+    never later than check_frequency so changes to the tasks file are still picked up.
+
+    Returns:
+        float: Seconds until the next check, at least one second.
+    """
+    current_time = time.time()
+    due_soon = settings.due_soon_secs
+    delay = settings.check_frequency
 
-    await aio_write_tasks(tasks)
+    if scheduled_tasks:
+        delay = min(delay, scheduled_tasks[0][0] - current_time)
+
+        # First task that has not yet come within due_soon_secs of being due
+        soon_index = bisect.bisect_right(scheduled_tasks, current_time + due_soon, key=itemgetter(0))
+        if soon_index < len(scheduled_tasks):
+            delay = min(delay, scheduled_tasks[soon_index][0] - due_soon - current_time)
+
+    return max(delay, 1.0)
 
 
 def handle_exit(signum, frame):
@@ -256,23 +546,45 @@ def handle_exit(signum, frame):
     logging.info("Received termination signal. Exiting gracefully.")
     sys.exit(0)
 
-# Set up signal handlers for graceful exit
+
+def handle_reload(signum, frame):
+    """
+    Signal handler for SIGHUP; reloads the settings from the config file.
+
+    Args:
+        signum (int): Signal number.
+        frame (object): Frame object.
+    """
+    global settings
+    try:
+        settings = read_settings()
+    except (configparser.Error, ValueError, OSError) as e:
+        # A bad config must not kill the running daemon, so keep the current settings
+        logging.warning("Error: Unable to reload configuration, keeping current settings: %s", str(e))
+        return
+    logging.info("Received reload signal. Configuration reloaded.")
+
+# Set up signal handlers for graceful exit and config reload
 signal.signal(signal.SIGINT, handle_exit)
 signal.signal(signal.SIGTERM, handle_exit)
+if hasattr(signal, 'SIGHUP'):
+    signal.signal(signal.SIGHUP, handle_reload)
 
 
 async def main():
     """
-    Asynchronously run the main background loop to check for due tasks periodically.
+    Asynchronously run the main background loop to check for due tasks as they come due.
     """
-    config = await aio_read_config()
-
-    # Uncomment the line below if you want to use a different check frequency from the config
-    check_frequency = int(config.get('notification', 'check_frequency_seconds', fallback=20))
+    await aio_migrate_completed_tasks()
 
     while True:
-        asyncio.create_task(aio_check_due_tasks())
-        await asyncio.sleep(check_frequency)
+        # Each check must finish before the next delay can be computed from the updated schedule
+        try:
+            await aio_check_due_tasks()
+        except Exception as e:
+            logging.exception("Error occurred while checking due tasks: %s", str(e))
+
+        await asyncio.sleep(next_check_delay())
 
 if __name__ == "__main__":
     try:
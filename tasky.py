@@ -1,15 +1,25 @@
 # Import necessary modules for the foreground script
+import os
+import re
 import sys
-import json
+import time
+import hmac
+import orjson
+import bisect
 import hashlib
-import asyncio
+import tempfile
 import schedule
+import itertools
+import threading
 import configparser
+from pathlib import Path
+from operator import le, itemgetter
 from pyfiglet import Figlet
+from rich.text import Text
 from rich.table import Table
 from datetime import datetime
 from rich.console import Console
-from pushbullet import Pushbullet
+from pushbullet import Pushbullet, InvalidKeyError
 
 # Initialize Rich Console for styling output
 console = Console()
@@ -37,33 +47,47 @@ tasks_file = config.get('paths', 'tasks_file', fallback='default_tasks_file')
 completed_tasks_file = config.get('paths', 'completed_tasks_file', fallback='default_due_tasks.json')
 
 
-# Custom JSON Encoder for handling datetime objects
-class TaskEncoder(json.JSONEncoder):
-    def default(self, obj):
-        if isinstance(obj, datetime):
-            return obj.strftime("%Y-%m-%d %H:%M:%S")
-        return super().default(obj)
+# Sort key ordering tasks by time and then priority. Priorities are kept as ints (see
+# normalize_priorities), so the C-implemented itemgetter can build the key directly.
+task_key = itemgetter('time', 'priority')
+
+
+def normalize_priorities(tasks):
+    """
+    Convert task priorities to ints, as older task files may store them as strings.
+
+    Args:
+        tasks (list): List of tasks, updated in place.
+
+    Returns:
+        list: The same list of tasks.
+    """
+    for task in tasks:
+        task['priority'] = int(task['priority'])
+    return tasks
 
 
 def sort_tasks(tasks):
     """
     Sort the list of tasks based on time and priority.
 
+    Note:
+        Task lists are kept sorted as they are modified, so this is only needed once
+        when loading a file that may not be in order.
+
     Args:
         tasks (list): List of tasks.
 
     Returns:
-        list: Sorted list of tasks.
+        list: Sorted list of tasks, or the same list if it is already sorted.
     """
     if isinstance(tasks, list):
+        # Files written by Tasky are already in order, so check before sorting
+        keys = list(map(task_key, tasks))
+        if all(map(le, keys, itertools.islice(keys, 1, None))):
+            return tasks
         # If tasks is a list, sort it by values
-        sorted_tasks = sorted(
-            tasks,
-            key=lambda x: (
-                x['time'],
-                int(x['priority'])
-            )
-        )
+        sorted_tasks = sorted(tasks, key=task_key)
     else:
         # Handle other cases as needed
         sorted_tasks = []
@@ -79,11 +103,10 @@ def load_tasks():
         list: Loaded or newly created list of tasks.
     """
     try:
-        with open(tasks_file, "r") as file:
-            tasks = json.load(file)
-    except (FileNotFoundError, json.JSONDecodeError):
+        tasks = orjson.loads(Path(tasks_file).read_bytes())
+    except (FileNotFoundError, orjson.JSONDecodeError):
         tasks = []
-    return sort_tasks(tasks)
+    return sort_tasks(normalize_priorities(tasks))
 
 
 def load_due_tasks():
@@ -91,18 +114,93 @@ def load_due_tasks():
     Load completed tasks from the completed tasks file or create an empty list.
 
     Returns:
-        list: Loaded or newly created list of completed tasks.
+        list: Loaded or newly created list of completed tasks, sorted by time and priority.
     """
     try:
-        with open(completed_tasks_file, "r") as file:
-            completed_tasks = json.load(file)
-    except (FileNotFoundError, json.JSONDecodeError):
+        with open(completed_tasks_file, "rb") as file:
+            first_line = file.readline()
+            # Completed tasks are stored as JSON Lines; older files hold a single JSON array
+            if first_line.lstrip().startswith(b'['):
+                completed_tasks = orjson.loads(first_line + file.read())
+            else:
+                lines = itertools.chain([first_line], file)
+                completed_tasks = [orjson.loads(line) for line in lines if line.strip()]
+    except (FileNotFoundError, orjson.JSONDecodeError):
         completed_tasks = []
+    return sort_tasks(normalize_priorities(completed_tasks))
+
+
+def get_completed_tasks():
+    """
+    Get the completed tasks, re-reading the completed tasks file only when it has changed.
+
+    Returns:
+        list: List of completed tasks.
+    """
+    global completed_tasks, completed_tasks_mtime
+    try:
+        mtime = os.stat(completed_tasks_file).st_mtime_ns
+    except FileNotFoundError:
+        return []
+
+    if mtime != completed_tasks_mtime:
+        completed_tasks = load_due_tasks()
+        completed_tasks_mtime = mtime
     return completed_tasks
 
-# Load tasks and completed tasks at the start of the program
+
+def group_tasks_by_name(tasks):
+    """
+    Group tasks by name.
+
+    Args:
+        tasks (list): List of tasks.
+
+    Returns:
+        dict: Task names mapped to the list of tasks with that name.
+    """
+    grouped_tasks = {}
+    for task in tasks:
+        grouped_tasks.setdefault(task['name'], []).append(task)
+    return grouped_tasks
+
+# Load tasks at the start of the program
 tasks = load_tasks()
-completed_tasks = load_due_tasks()
+
+# Completed tasks are loaded on first view, then reloaded only when the background script
+# appends to the completed tasks file
+completed_tasks = []
+completed_tasks_mtime = None
+
+# Tasks grouped by name for constant-time lookups; names are not required to be unique
+tasks_by_name = group_tasks_by_name(tasks)
+
+# Whether tasks has changed since it was last saved
+tasks_dirty = False
+
+# Pushbullet access token keyed by the config file's modification time
+access_token_cache = {}
+
+# Shared Pushbullet client and the access token it was created with
+pb_client = None
+pb_client_token = None
+
+# Number of times to try sending a notification before giving up
+notification_attempts = 3
+
+
+def get_access_token():
+    """
+    Get the Pushbullet access token, re-reading the configuration file only when it has changed.
+
+    Returns:
+        str: Pushbullet access token, or None if not set.
+    """
+    mtime = os.stat(config_file).st_mtime_ns
+    if access_token_cache.get('mtime') != mtime:
+        access_token_cache['access_token'] = read_config().get('Pushbullet', 'access_token', fallback=None)
+        access_token_cache['mtime'] = mtime
+    return access_token_cache['access_token']
 
 
 def send_notification(title, body):
@@ -113,18 +211,31 @@ def send_notification(title, body):
         title (str): Notification title.
         body (str): Notification body.
     """
-    config = read_config()
-    access_token = config.get('Pushbullet', 'access_token', fallback=None)
+    global pb_client, pb_client_token
+    access_token = get_access_token()
 
-    try:
-        if access_token:
-            pb = Pushbullet(access_token)
-            pb.push_note(title, body)
-        else:
-            console.print("Pushbullet access token not found in the config file.", style="bold red")
-            pass
-    except Exception:
-        console.print("Error sending notification. Check internet connection, API key push limit and pushbullet.com to troubleshoot", style="bold red")
+    if not access_token:
+        console.print("Pushbullet access token not found in the config file.", style="bold red")
+        return
+
+    for attempt in range(notification_attempts):
+        try:
+            # Pushbullet's constructor makes an HTTP request, so only build a client when the token changes
+            if pb_client is None or pb_client_token != access_token:
+                pb_client = Pushbullet(access_token)
+                pb_client_token = access_token
+            pb_client.push_note(title, body)
+            return
+        except InvalidKeyError:
+            # Retrying won't help with a rejected access token
+            break
+        except Exception:
+            # Drop the client so a broken connection isn't reused, and back off before retrying
+            pb_client = None
+            if attempt < notification_attempts - 1:
+                time.sleep(0.5 * 2 ** attempt)
+
+    console.print("Error sending notification. Check internet connection, API key push limit and pushbullet.com to troubleshoot", style="bold red")
 
 
 def save_tasks():
@@ -132,15 +243,35 @@ def save_tasks():
     Save tasks to the tasks file.
 
     Note:
+        Does nothing if the tasks have not changed since they were last saved.
         Sends an error notification if saving fails.
     """
+    global tasks_dirty
+    if not tasks_dirty:
+        return
+
     try:
-        with open(tasks_file, "w") as file:
-            if tasks:
-                sorted_tasks = sort_tasks(tasks)
-                json.dump(sorted_tasks, file, cls=TaskEncoder)
-            else:
-                console.print("No tasks to save.", style="bold yellow")
+        # Write to a temporary file and swap it in, so an interrupted save can't corrupt the tasks file.
+        # The temporary file is unique, as the background script may be saving the tasks file at the same time
+        fd, tmp_file = tempfile.mkstemp(dir=os.path.dirname(tasks_file) or '.', prefix=os.path.basename(tasks_file))
+        try:
+            with os.fdopen(fd, "wb") as file:
+                if tasks:
+                    file.write(orjson.dumps(tasks, option=orjson.OPT_APPEND_NEWLINE))
+                else:
+                    console.print("No tasks to save.", style="bold yellow")
+                file.flush()
+                os.fsync(file.fileno())
+            # mkstemp creates the file private to the owner, so keep the tasks file's permissions
+            try:
+                os.chmod(tmp_file, os.stat(tasks_file).st_mode & 0o777)
+            except FileNotFoundError:
+                os.chmod(tmp_file, 0o644)
+            os.replace(tmp_file, tasks_file)
+        except BaseException:
+            os.remove(tmp_file)
+            raise
+        tasks_dirty = False
     except (PermissionError, FileNotFoundError):
         send_notification("Tasky:", "Error:\nUnable to save tasks. Check file permissions and try again.")
         console.print("Error: Unable to save tasks. Check file permissions and try again.", style="bold red")
@@ -155,9 +286,9 @@ def hash_passkey(passkey):
         passkey (str): User's passkey.
 
     Returns:
-        str: Hashed passkey.
+        bytes: Hashed passkey digest.
     """
-    hashed_passkey = hashlib.sha256(passkey.encode()).hexdigest()
+    hashed_passkey = hashlib.sha256(passkey.encode()).digest()
     return hashed_passkey
 
 
@@ -178,7 +309,8 @@ def authenticate_user():
         entered_passkey = console.input("[bold white]\nEnter Passkey[bold white]: ").strip()
         hashed_entered_passkey = hash_passkey(entered_passkey)
 
-        if hashed_entered_passkey == stored_hashed_passkey:
+        # Constant-time comparison so response timing doesn't leak the stored hash
+        if hmac.compare_digest(hashed_entered_passkey, stored_hashed_passkey):
             return
         send_notification("Tasky:", "Passkey Authentication Failed!")
         console.print("Incorrect Passkey", style="bold red")
@@ -233,6 +365,13 @@ def get_task():
         return task, task_time, int(priority)
 
 
+# Possible task time formats, most common first
+time_formats = ['%Y-%m-%d %H:%M', '%H:%M', '%Y-%m-%d', '%I:%M %p', '%I %p']
+
+# Pattern for the full, zero-padded "YYYY-MM-DD HH:MM" task time format
+iso_time_pattern = re.compile(r'^\d{4}-\d{2}-\d{2} \d{2}:\d{2}$')
+
+
 def convert_to_consistent_format(user_task_time, time_format):
     """
     Convert user-provided task time to a consistent datetime format.
@@ -244,20 +383,31 @@ def convert_to_consistent_format(user_task_time, time_format):
     Returns:
         datetime: Consistent datetime object.
     """
-    # Define a list of possible time formats to try
-    time_formats = ['%Y-%m-%d %H:%M', '%H:%M', '%Y-%m-%d', '%I:%M %p', '%I %p']
+    # Build the common full "YYYY-MM-DD HH:MM" format directly, without strptime
+    if iso_time_pattern.match(user_task_time):
+        try:
+            return datetime(
+                int(user_task_time[0:4]),
+                int(user_task_time[5:7]),
+                int(user_task_time[8:10]),
+                int(user_task_time[11:13]),
+                int(user_task_time[14:16])
+            )
+        except ValueError:
+            # Out of range values; let the formats below reject it
+            pass
 
-    for time_format in time_formats:
+    for fmt in time_formats:
         try:
             # Try parsing the user input with the specified time format
-            task_datetime = datetime.strptime(user_task_time, time_format)
+            task_datetime = datetime.strptime(user_task_time, fmt)
 
             # Check if user time is already in full datetime format and return a date object version of user time
-            if time_format == '%Y-%m-%d %H:%M':
+            if fmt == '%Y-%m-%d %H:%M':
                 return task_datetime
 
             # If the format includes only time, add the current date
-            elif '%H:%M' in time_format or '%I:%M %p' in time_format or '%I %p' in time_format:
+            elif '%H:%M' in fmt or '%I:%M %p' in fmt or '%I %p' in fmt:
                 # Get the current date components
                 current_date = datetime.now().date()
 
@@ -303,6 +453,21 @@ def time_is_valid(user_task_time):
     return task_datetime > current_datetime
 
 
+def yesno(prompt, default=True):
+    """
+    Ask the user a yes/no question.
+
+    Args:
+        prompt (str): Prompt to display.
+        default (bool): Answer to use if the user just presses Enter.
+
+    Returns:
+        bool: True if the user answered yes, False otherwise.
+    """
+    answer = console.input(prompt).strip()
+    return answer[:1] in ('y', 'Y') if answer else default
+
+
 def add_task():
     """
     Add a new task to the task list.
@@ -312,26 +477,25 @@ def add_task():
     """
     for _ in range(3):
         new_task, task_time, priority = get_task()
-        if time_is_valid(task_time):
+        valid = time_is_valid(task_time)
+        if valid:
             console.print("Valid....", style="dim bold green")
-            pass
+
         # Verify task before adding to task list
         console.print(f'[bold white]\nYour Task[bold white]: [dim bold white italic underline]{new_task}[dim bold white italic underline]')
         console.print(f'[bold white]Your Task Time[bold white]: [dim bold white italic underline]{task_time}[dim bold white italic underline]')
         console.print(f'[bold white]Priority Level[bold white]: [dim bold white italic underline]{priority}[dim bold white italic underline]')
-        confirm_task = console.input("[bold white]Confirm to add task? (Default is Yes)[bold white] [bold italic yellow]Y/N[bold italic yellow]: ").strip().lower()
-
-        if confirm_task == "n":
+        if not yesno("[bold white]Confirm to add task? (Default is Yes)[bold white] [bold italic yellow]Y/N[bold italic yellow]: "):
             continue
 
-        if not time_is_valid(task_time):
+        if not valid:
             console.print(f"[bold red]Invalid time[bold red]. ([bold italic white]{task_time}[bold italic white]) [bold red]Please make sure time is in the future and in correct format.[bold red]")
             continue
-        elif not confirm_task or confirm_task == "y":
-            add_task_to_list(new_task, task_time, priority)
-            console.print(f"[bold green]Task:[bold green] [bold italic white]{new_task}[bold italic white] [bold green]added successfully![bold green]")
-            send_notification("Tasky:", f"New Task Added!\nTask: {new_task}\nTime: {task_time}\nPriority Level: {priority}")
-            break
+
+        add_task_to_list(new_task, task_time, priority)
+        console.print(f"[bold green]Task:[bold green] [bold italic white]{new_task}[bold italic white] [bold green]added successfully![bold green]")
+        send_notification("Tasky:", f"New Task Added!\nTask: {new_task}\nTime: {task_time}\nPriority Level: {priority}")
+        break
 
     save_tasks()
 
@@ -345,6 +509,7 @@ def add_task_to_list(task, task_time, priority):
         task_time (str): Task time.
         priority (int): Task priority level.
     """
+    global tasks_dirty
     task = task.strip()
     task_time = task_time.strip()
 
@@ -355,72 +520,116 @@ def add_task_to_list(task, task_time, priority):
     converted_datetime = convert_to_consistent_format(task_time, time_format)
 
     # Convert the task datetime back to string before adding to dictionary
-    datetime_str = converted_datetime.strftime("%Y-%m-%d %H:%M:%S")
+    datetime_str = converted_datetime.isoformat(sep=" ", timespec="seconds")
 
     # Create a dictionary for the new task
     new_task = {"name": task, "time": datetime_str, "priority": priority}
 
-    tasks.append(new_task)
+    # Insert in order so the tasks list stays sorted
+    bisect.insort(tasks, new_task, key=task_key)
+    tasks_by_name.setdefault(task, []).append(new_task)
+    tasks_dirty = True
 
 
-def display_tasks():
+def task_position(task):
     """
-    Display the current tasks in a formatted table.
+    Find the position of a task in the sorted tasks list.
+
+    Args:
+        task (dict): Task in the tasks list.
+
+    Returns:
+        int: Index of the task in the tasks list.
+    """
+    idx = bisect.bisect_left(tasks, task_key(task), key=task_key)
+    # Step past other tasks with the same time and priority
+    while tasks[idx] is not task:
+        idx += 1
+    return idx
+
+
+def unindex_task(task):
     """
-    table = Table(title="Current Tasks\n", title_style="bold magenta underline", show_lines=True, show_edge=False)
+    Remove a task from the name lookup.
+
+    Args:
+        task (dict): Task to remove.
+    """
+    same_name = tasks_by_name[task['name']]
+    same_name.remove(task)
+    if not same_name:
+        del tasks_by_name[task['name']]
+
+
+def render_tasks_table(title, source, time_header="Time", empty_message="No tasks available."):
+    """
+    Display a list of tasks in a formatted table.
+
+    Args:
+        title (str): Table title.
+        source (list): Sorted list of tasks to display.
+        time_header (str): Header of the task time column.
+        empty_message (str): Message to display instead if there are no tasks.
+    """
+    if not source:
+        console.print(empty_message, style="bold white")
+        return
+
+    table = Table(title=title, title_style="bold magenta underline", show_lines=True, show_edge=False)
     table.add_column("Index", style="bold white")
     table.add_column("Task", style="bold white")
-    table.add_column("Time", style="bold white")
+    table.add_column(time_header, style="bold white")
     table.add_column("Priority Level", style="bold white")
 
-    if not tasks:
-        console.print("No tasks available.", style="bold white")
-    else:
-        sorted_tasks = sort_tasks(tasks)
-
-        for idx, task_data in enumerate(sorted_tasks, start=1):
-            task = task_data['name']
-            task_time = task_data['time']
-            priority = task_data['priority']
-
-            table.add_row(
-                str(idx),
-                task,
-                task_time,
-                str(priority)
-            )
+    for idx, task_data in enumerate(source, start=1):
+        # Task names are user input, so add them as plain Text rather than parsing them as markup
+        table.add_row(
+            str(idx),
+            Text(task_data['name']),
+            task_data['time'],
+            str(task_data['priority'])
+        )
 
-        console.print(table)
+    console.print(table)
+
+
+def display_tasks():
+    """
+    Display the current tasks in a formatted table.
+    """
+    render_tasks_table("Current Tasks\n", tasks)
 
 
 def delete_task():
     """
     Delete a task based on user input (index or task name).
     """
+    global tasks_dirty
     display_tasks()
 
     # Get user input for task deletion
     user_input = console.input("[bold white]\nEnter the index or name of the task to delete[bold white]: ").strip()
 
-    sorted_tasks = sort_tasks(tasks)
     # Validate user input
     if user_input.isdigit():
         index = int(user_input)
         if 1 <= index <= len(tasks):
-            task_to_delete = sorted_tasks[index - 1]["name"]
-            confirm_deletion = console.input(f"[bold yellow]Confirm to delete task[bold yellow] '[italic white]{task_to_delete}[italic white]' [italic bold yellow]? (Y/N)[italic bold yellow]: ").strip().lower()
-            if confirm_deletion == 'y':
-                del tasks[index - 1]
+            task_to_delete = tasks[index - 1]["name"]
+            if yesno(f"[bold yellow]Confirm to delete task[bold yellow] '[italic white]{task_to_delete}[italic white]' [italic bold yellow]? (Y/N)[italic bold yellow]: ", default=False):
+                unindex_task(tasks.pop(index - 1))
+                tasks_dirty = True
                 send_notification("Tasky:", f"Task: '{task_to_delete}' deleted!")
                 console.print(f"[bold green]Task '[italic white]{task_to_delete}[italic white]' [bold green]deleted[bold green].")
             else:
                 console.print("Deletion canceled.", style="bold green")
         else:
             console.print("Invalid index. Please enter a valid index.", style="bold red")
-    elif any(task['name'] == user_input for task in tasks):
-        confirm_deletion = console.input(f"[bold yellow]Confirm to delete task[bold yellow] '[italic white]{user_input}[italic white]' [italic bold yellow]? (Y/N)[italic bold yellow]: ").strip().lower()
-        if confirm_deletion == 'y':
-            tasks[:] = [task for task in tasks if task['name'] != user_input]
+    elif user_input in tasks_by_name:
+        if yesno(f"[bold yellow]Confirm to delete task[bold yellow] '[italic white]{user_input}[italic white]' [italic bold yellow]? (Y/N)[italic bold yellow]: ", default=False):
+            # Delete every task with this name
+            for task in tasks_by_name.pop(user_input):
+                del tasks[task_position(task)]
+            tasks_dirty = True
             console.print(f"[bold green]Task[bold green] '[italic white]{user_input}[italic white]' [bold green]deleted.[bold green]")
         else:
             console.print("Deletion canceled.", style="bold green")
@@ -433,30 +642,7 @@ def preview_tasks():
     """
     Display a preview of the tasks in a formatted table.
     """
-    table = Table(title="Task Preview\n", title_style="bold magenta underline", show_lines=True, show_edge=False)
-    table.add_column("Index", style="bold white")
-    table.add_column("Task", style="bold white")
-    table.add_column("Time", style="bold white")
-    table.add_column("Priority Level", style="bold white")
-
-    if not tasks:
-        console.print("No tasks available.", style="bold white")
-    else:
-        sorted_tasks = sort_tasks(tasks)
-
-        for idx, task_data in enumerate(sorted_tasks, start=1):
-            task = task_data['name']
-            task_time = task_data['time']
-            priority = task_data['priority']
-
-            table.add_row(
-                str(idx),
-                task,
-                task_time,
-                str(priority)
-            )
-
-        console.print(table)
+    render_tasks_table("Task Preview\n", tasks)
 
 
 def update_task():
@@ -469,35 +655,39 @@ def update_task():
         # Get user input for task update
         user_input = console.input("[bold white]\nEnter the index or name of the task to update[bold white]: ").strip()
 
-        sorted_tasks = sort_tasks(tasks)
         # Validate user input
         if user_input.isdigit():
             index = int(user_input)
             if 1 <= index <= len(tasks):
-                task_to_update = sorted_tasks[index - 1]['name']
-                console.print(f"[bold green]Updating[bold green] [italic white]{index}. {task_to_update}[italic white][green]...[green]")
+                task_to_update = tasks[index - 1]
+                console.print(f"[bold green]Updating[bold green] [italic white]{index}. {task_to_update['name']}[italic white][green]...[green]")
+                # Update the selected row itself, not the first task sharing its name
                 update_task_details(task_to_update)
                 break
             else:
                 console.print("Invalid index. Please enter a valid index.", style="bold red")
                 continue
-        elif user_input in [task['name'] for task in tasks]:
+        elif user_input in tasks_by_name:
             console.print(f"[bold green]Updating[bold green] [italic white]{user_input}[italic white][bold green]...[bold green]")
-            update_task_details(user_input)
-            save_tasks()
+            update_task_details(tasks_by_name[user_input][0])
             break
         else:
             console.print("Invalid input. Please enter a valid index or task name.", style="bold red")
             continue
 
+    save_tasks()
+
 
-def update_task_details(task_name):
+def update_task_details(current):
     """
     Update details of a specific task.
 
     Args:
-        task_name (str): Name of the task to be updated.
+        current (dict): Task to be updated, as stored in the tasks list.
     """
+    global tasks_dirty
+    task_name = current['name']
+
     # Get updated details from the user
     updated_task_name = console.input("[bold white]Enter updated task name [italic](press Enter to keep the same)[italic][bold white]: ").strip()
     for _ in range(5):
@@ -506,29 +696,37 @@ def update_task_details(task_name):
         if updated_task_time and time_is_valid(updated_task_time):
             updated_task_time = convert_to_consistent_format(updated_task_time, time_format)
             # Convert the task datetime back to string before adding to dictionary
-            updated_task_time = updated_task_time.strftime("%Y-%m-%d %H:%M:%S")
+            updated_task_time = updated_task_time.isoformat(sep=" ", timespec="seconds")
             break
         elif updated_task_time == "":
             break
         else:
-            updated_task_time = tasks[tasks.index(next(task for task in tasks if task['name'] == task_name))]['time']
+            updated_task_time = current['time']
             console.print(f"Invalid time. Please make sure time is in the future and in correct format.", style="bold red")
             continue
     updated_priority = console.input("[bold white]Enter updated priority ([italic]press Enter to keep the same[italic])[bold white]: ").strip()
+    if updated_priority and (not updated_priority.isdigit() or int(updated_priority) not in {1, 2, 3}):
+        console.print("Invalid priority level. Keeping the current priority.", style="bold red")
+        updated_priority = ""
 
-    confirm_update = console.input(f"[bold yellow]Confirm to update task?[bold yellow] [italic bold white]'{task_name}'[italic bold white]: [bold yellow](Default is Y)[bold yellow] [italic bold yellow]Y/N[italic bold yellow]: ").strip().lower()
-    if not confirm_update or confirm_update == "y":
+    if yesno(f"[bold yellow]Confirm to update task?[bold yellow] [italic bold white]'{task_name}'[italic bold white]: [bold yellow](Default is Y)[bold yellow] [italic bold yellow]Y/N[italic bold yellow]: "):
 
         # If user entered only an updated time or priority, keep the existing values for other details
-        updated_task_time = updated_task_time or next(task for task in tasks if task['name'] == task_name)['time']
-        updated_priority = updated_priority or next(task for task in tasks if task['name'] == task_name)['priority']
+        updated_task_time = updated_task_time or current['time']
+        updated_priority = int(updated_priority) if updated_priority else current['priority']
 
-        # Update the task with the provided details
-        tasks[tasks.index(next(task for task in tasks if task['name'] == task_name))] = {
+        # Update the task in place, then move it to keep the tasks list sorted
+        idx = task_position(current)
+        unindex_task(current)
+        current.update({
             'name': updated_task_name or task_name,
             'time': updated_task_time,
             'priority': updated_priority,
-        }
+        })
+        del tasks[idx]
+        bisect.insort(tasks, current, key=task_key)
+        tasks_by_name.setdefault(current['name'], []).append(current)
+        tasks_dirty = True
 
         send_notification("Tasky:", f"Task: {task_name} updated!")
         console.print(f"[bold green]Task[bold green] [italic bold white]'{task_name}'[italic bold white] [bold green]updated![bold green]")
@@ -543,15 +741,19 @@ def load_hashed_passkey():
     Load the hashed passkey from the passkey.txt file.
 
     Returns:
-        str: Hashed passkey.
+        bytes: Hashed passkey digest.
     """
     try:
-        with open("passkey.txt", "r") as file:
-            return file.read().strip()
+        stored_hashed_passkey = Path("passkey.txt").read_bytes()
     except FileNotFoundError:
         # If file not found, use a default passkey and hash it
         return hash_passkey("tasky")
 
+    # Passkeys saved by older versions are stored as a hex digest
+    if len(stored_hashed_passkey) != hashlib.sha256().digest_size:
+        stored_hashed_passkey = bytes.fromhex(stored_hashed_passkey.decode().strip())
+    return stored_hashed_passkey
+
 
 # Function to save hashed passkey to a file
 def save_hashed_passkey(passkey):
@@ -559,9 +761,9 @@ def save_hashed_passkey(passkey):
     Save the hashed passkey to the passkey.txt file.
 
     Args:
-        passkey (str): Passkey to be hashed and saved.
+        passkey (bytes): Hashed passkey digest to be saved.
     """
-    with open("passkey.txt", "w") as file:
+    with open("passkey.txt", "wb") as file:
         file.write(passkey)
 
 
@@ -570,6 +772,9 @@ def update_passkey():
     """
     Update the passkey based on user input.
     """
+    # The stored passkey can't change between attempts, so read it once
+    stored_hashed_passkey = load_hashed_passkey()
+
     for trials in range(4):
         if trials == 3:
             # Exit if maximum trials reached
@@ -579,9 +784,8 @@ def update_passkey():
             sys.exit()
 
         current_passkey = console.input("[bold white]Enter the current passkey[bold white]: ").strip()
-        stored_hashed_passkey = load_hashed_passkey()
 
-        if hash_passkey(current_passkey) == stored_hashed_passkey:
+        if hmac.compare_digest(hash_passkey(current_passkey), stored_hashed_passkey):
             for tries in range(4):
                 if tries == 3:
                     # Exit if maximum trials reached
@@ -601,9 +805,9 @@ def update_passkey():
                     save_hashed_passkey(hash_passkey(new_passkey))
                     console.print("Passkey updated successfully!", style="bold green")
                     send_notification("Tasky:", "Passkey Updated successfully!")
-                    break
+                    return
 
-        elif hash_passkey(current_passkey) != stored_hashed_passkey:
+        else:
             # Notify if current passkey is incorrect
             #send_notification("Tasky:", "Incorrect passkey. Passkey Update failed!")
             console.print("Incorrect passkey! Try again.", style="bold red")
@@ -623,41 +827,44 @@ def view_past_tasks():
     """
     Display a table of completed tasks.
     """
-    table = Table(title="Completed Tasks\n", title_style="bold magenta underline", show_lines=True, show_edge=False)
-    table.add_column("Index", style="bold white")
-    table.add_column("Task", style="bold white")
-    table.add_column("Date", style="bold white")
-    table.add_column("Priority Level", style="bold white")
+    # Completed tasks are sorted once when the file is loaded
+    render_tasks_table("Completed Tasks\n", get_completed_tasks(), "Date", "Tasks History is empty.")
+
+
+# Render the static ASCII art banners once rather than on every menu redraw
+intro_banner = Figlet(font='graffiti').renderText("      TASKY")
+options_banner = Figlet(font='term').renderText("\nOPTIONS")
+
+
+def run_scheduler():
+    """
+    Run pending scheduled jobs in the background, independently of user input.
+    """
+    while True:
+        schedule.run_pending()
+        time.sleep(1)
 
-    if not completed_tasks:
-        console.print("Tasks History is empty.", style="bold white")
-    else:
-        sorted_tasks = sort_tasks(completed_tasks)
-
-        for idx, task_data in enumerate(sorted_tasks, start=1):
-            task = task_data['name']
-            task_time = task_data['time']
-            priority = task_data['priority']
-
-            table.add_row(
-                str(idx),
-                task,
-                task_time,
-                str(priority)
-            )
 
-        console.print(table)
+# Menu option functions and names, indexed by option number
+options = (
+    None,
+    (add_task, "Add Task"),
+    (delete_task, "Delete Task"),
+    (preview_tasks, "Preview Tasks"),
+    (update_task, "Update Task"),
+    (update_passkey, "Change Passkey"),
+    (exit_program, "Exit"),
+    (view_past_tasks, "View Task History"),
+)
 
 
-async def main():
-    # Run scheduled jobs
-    schedule.run_pending()
+def main():
+    # Run scheduled jobs on a daemon thread so they fire on time while the menu waits for input
+    threading.Thread(target=run_scheduler, daemon=True).start()
 
     try:
         # Display Tasky ASCII art and introduction
-        f = Figlet(font='graffiti')
-        intro_f = (f.renderText("      TASKY"))
-        console.print(intro_f, style="bold blue")
+        console.print(intro_banner, style="bold blue")
         console.print("_._AN EFFICIENT INTERACTIVE C.L.I TOOL FOR TASK MANAGEMENT_._", style="dim bold black")
         console.print("-Schedule reminders as tasks[bold black]...[bold black]", style="italic bold black")
         console.print("-Schedule terminal commands as tasks[bold black]...[bold black]", style="italic bold black")
@@ -672,9 +879,7 @@ async def main():
 
         while True:
             # Display available options
-            f = Figlet(font='term')
-            options_f = f.renderText("\nOPTIONS")
-            console.print(options_f, style="bold white underline")
+            console.print(options_banner, style="bold white underline")
             console.print("1: Add Task", style="bold magenta")
             console.print("2: Delete Task", style="bold magenta")
             console.print("3: Preview Tasks", style="bold magenta")
@@ -683,48 +888,21 @@ async def main():
             console.print("6: Exit Program", style="magenta")
             console.print("7: View Task History", style="bold magenta")
 
-            # Mapping user options to corresponding functions
-            option_functions = {
-                1: add_task,
-                2: delete_task,
-                3: preview_tasks,
-                4: update_task,
-                5: update_passkey,
-                6: exit_program,
-                7: view_past_tasks,
-            }
-
             for _ in range(3):
                 user_option = get_option()
-                if user_option in option_functions:
-                    option_name = {
-                        1: "Add Task",
-                        2: "Delete Task",
-                        3: "Preview Tasks",
-                        4: "Update Task",
-                        5: "Change Passkey",
-                        6: "Exit",
-                        7: "View Task History"
-                    }[user_option]
-
+                if 0 < user_option < len(options):
+                    option_function, option_name = options[user_option]
                     console.print(f"[bold blue]Executing[bold blue]: [bold magenta]{option_name}....[bold magenta]\n")
-                    option_functions[user_option]()
+                    option_function()
                     break
-                elif user_option == 6:
-                    console.print("Exiting program....\n", style="blue")
-                    break  # Break out of the loop to exit the program
-
                 else:
                     console.print("Invalid option. Please choose a valid option.", style="bold red")
                     continue
 
-            # Run scheduled jobs after the loop
-            schedule.run_pending()
-
     except KeyboardInterrupt:
         console.print("\nProgram interrupted. Exiting...\n", style="bold blue")
         sys.exit()
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    main()